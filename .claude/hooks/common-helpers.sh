@@ -39,9 +39,19 @@ log_success() {
 # PERFORMANCE TIMING
 # ============================================================================
 
+# Milliseconds since the epoch; bash 5's EPOCHREALTIME avoids forking date
+current_time_ms() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local micros="${EPOCHREALTIME//[!0-9]/}"  # Decimal separator is locale dependent
+        echo $((micros / 1000))
+    else
+        echo $(($(date +%s%N)/1000000))
+    fi
+}
+
 time_start() {
     if [[ "${CLAUDE_HOOKS_DEBUG:-0}" == "1" ]]; then
-        echo $(($(date +%s%N)/1000000))
+        current_time_ms
     fi
 }
 
@@ -49,7 +59,7 @@ time_end() {
     if [[ "${CLAUDE_HOOKS_DEBUG:-0}" == "1" ]]; then
         local start=$1
         local end
-        end=$(($(date +%s%N)/1000000))
+        end=$(current_time_ms)
         local duration=$((end - start))
         log_debug "Execution time: ${duration}ms"
     fi
@@ -79,13 +89,28 @@ find_project_root() {
             echo "$dir"
             return 0
         fi
-        dir="$(dirname "$dir")"
+        dir="${dir%/*}"
+        dir="${dir:-/}"  # Parent directory by parameter expansion, no dirname fork
     done
     # No project root found, return current directory
     echo "$PWD"
     return 1
 }
 
+# Print the directory holding the enclosing .git (a directory, or a file for
+# worktrees and submodules), like `git rev-parse --show-toplevel` without git
+find_git_toplevel() {
+    local dir="$PWD"
+    while true; do
+        if [[ -e "${dir:-/}/.git" ]]; then
+            echo "${dir:-/}"
+            return 0
+        fi
+        [[ -z "$dir" ]] && return 1
+        dir="${dir%/*}"
+    done
+}
+
 # Load project configuration
 load_project_config() {
     # User-level config
@@ -176,24 +201,43 @@ exit_with_test_failure() {
 # FILE FILTERING
 # ============================================================================
 
+# .claude-hooks-ignore patterns, loaded once per working directory
+CLAUDE_HOOKS_IGNORE_PWD=""
+CLAUDE_HOOKS_IGNORE_ROOT=""
+CLAUDE_HOOKS_IGNORE_PATTERNS=()
+
+# Resolve the project root and read its .claude-hooks-ignore (minus comments
+# and blank lines) so should_skip_file doesn't redo it for every file
+load_ignore_patterns() {
+    [[ "$CLAUDE_HOOKS_IGNORE_PWD" == "$PWD" ]] && return 0
+    
+    CLAUDE_HOOKS_IGNORE_PWD="$PWD"
+    CLAUDE_HOOKS_IGNORE_ROOT=$(find_project_root)
+    CLAUDE_HOOKS_IGNORE_PATTERNS=()
+    
+    if [[ -f "$CLAUDE_HOOKS_IGNORE_ROOT/.claude-hooks-ignore" ]]; then
+        local pattern
+        while IFS= read -r pattern; do
+            # Skip comments and empty lines
+            [[ -z "$pattern" || "$pattern" =~ ^[[:space:]]*# ]] && continue
+            CLAUDE_HOOKS_IGNORE_PATTERNS+=("$pattern")
+        done < "$CLAUDE_HOOKS_IGNORE_ROOT/.claude-hooks-ignore"
+    fi
+}
+
 # Check if we should skip a file based on .claude-hooks-ignore
 should_skip_file() {
     local file="$1"
-    local project_root
-    project_root=$(find_project_root)
+    load_ignore_patterns
     
-    # Check .claude-hooks-ignore if it exists in project root
-    if [[ -f "$project_root/.claude-hooks-ignore" ]]; then
+    if [[ ${#CLAUDE_HOOKS_IGNORE_PATTERNS[@]} -gt 0 ]]; then
         # Make file path relative to project root for pattern matching
-        local relative_file="${file#"$project_root"/}"
-        # Also get just the basename for matching
-        local base_file
-        base_file=$(basename "$file")
+        local relative_file="${file#"$CLAUDE_HOOKS_IGNORE_ROOT"/}"
+        # Also get just the basename for matching (parameter expansion, no fork)
+        local base_file="${file##*/}"
         
-        while IFS= read -r pattern; do
-            # Skip comments and empty lines
-            [[ -z "$pattern" || "$pattern" =~ ^[[:space:]]*# ]] && continue
-            
+        local pattern
+        for pattern in "${CLAUDE_HOOKS_IGNORE_PATTERNS[@]}"; do
             # Check if pattern ends with /** for directory matching
             if [[ "$pattern" == */** ]]; then
                 local dir_pattern="${pattern%/**}"
@@ -223,13 +267,18 @@ should_skip_file() {
                 log_debug "Skipping $file due to .claude-hooks-ignore pattern: $pattern"
                 return 0
             fi
-        done < "$project_root/.claude-hooks-ignore"
+        done
     fi
     
-    # Check for inline skip comments
-    if [[ -f "$file" ]] && head -n 5 "$file" 2>/dev/null | grep -q "claude-hooks-disable"; then
-        log_debug "Skipping $file due to inline claude-hooks-disable comment"
-        return 0
+    # Check for inline skip comments in the first 5 lines, read in-shell
+    if [[ -f "$file" && -r "$file" ]]; then
+        local line count=0
+        while (( count++ < 5 )) && { IFS= read -r line || [[ -n "$line" ]]; }; do
+            if [[ "$line" == *claude-hooks-disable* ]]; then
+                log_debug "Skipping $file due to inline claude-hooks-disable comment"
+                return 0
+            fi
+        done < "$file"
     fi
     
     return 1
@@ -262,16 +311,16 @@ output_json_response() {
             ;;
     esac
     
-    # Add message if provided
+    # Add message if provided; quotes are escaped in place rather than piped through sed
     if [[ -n "$message" ]]; then
-        json+=",\"message\":\"$(echo -n "$message" | sed 's/"/\\"/g')\""
+        json+=",\"message\":\"${message//\"/\\\"}\""
     fi
     
     # Add any additional fields
     for field in "$@"; do
         local key="${field%%:*}"
         local value="${field#*:}"
-        json+=",\"$key\":\"$(echo -n "$value" | sed 's/"/\\"/g')\""
+        json+=",\"$key\":\"${value//\"/\\\"}\""
     done
     
     # Close JSON object
@@ -311,7 +360,8 @@ find_project_command_root() {
             return 1
         fi
         
-        dir="$(dirname "$dir")"
+        dir="${dir%/*}"
+        dir="${dir:-/}"  # Parent directory by parameter expansion, no dirname fork
     done
     
     return 1
@@ -428,23 +478,43 @@ detect_project_type() {
     local project_type="unknown"
     local types=()
     
+    # One walk of the tree (skipping dependency, VCS and virtualenv dirs) collects
+    # which source extensions exist; each name is dispatched on its extension
+    # instead of running a find per language
+    local has_go=false has_python=false has_js=false has_rust=false
+    local name
+    while IFS= read -r -d '' name; do
+        case "$name" in
+            *.go) has_go=true ;;
+            *.py) has_python=true ;;
+            *.js|*.ts|*.jsx|*.tsx) has_js=true ;;
+            *.rs) has_rust=true ;;
+        esac
+        # Nothing left to learn once every language has been seen
+        if [[ "$has_go" == "true" && "$has_python" == "true" && "$has_js" == "true" && "$has_rust" == "true" ]]; then
+            break
+        fi
+    done < <(find . -maxdepth 3 -type d \( -name node_modules -o -name .git -o -name "*venv" \) -prune \
+        -o -type f \( -name "*.go" -o -name "*.py" -o -name "*.js" -o -name "*.ts" -o -name "*.jsx" -o -name "*.tsx" \
+        -o -name "*.rs" \) -print0 2>/dev/null)
+    
     # Go project
-    if [[ -f "go.mod" ]] || [[ -f "go.sum" ]] || [[ -n "$(find . -maxdepth 3 -name "*.go" -type f -print -quit 2>/dev/null)" ]]; then
+    if [[ -f "go.mod" ]] || [[ -f "go.sum" ]] || [[ "$has_go" == "true" ]]; then
         types+=("go")
     fi
     
     # Python project
-    if [[ -f "pyproject.toml" ]] || [[ -f "setup.py" ]] || [[ -f "requirements.txt" ]] || [[ -n "$(find . -maxdepth 3 -name "*.py" -type f -print -quit 2>/dev/null)" ]]; then
+    if [[ -f "pyproject.toml" ]] || [[ -f "setup.py" ]] || [[ -f "requirements.txt" ]] || [[ "$has_python" == "true" ]]; then
         types+=("python")
     fi
     
     # JavaScript/TypeScript project
-    if [[ -f "package.json" ]] || [[ -f "tsconfig.json" ]] || [[ -n "$(find . -maxdepth 3 \( -name "*.js" -o -name "*.ts" -o -name "*.jsx" -o -name "*.tsx" \) -type f -print -quit 2>/dev/null)" ]]; then
+    if [[ -f "package.json" ]] || [[ -f "tsconfig.json" ]] || [[ "$has_js" == "true" ]]; then
         types+=("javascript")
     fi
     
     # Rust project
-    if [[ -f "Cargo.toml" ]] || [[ -n "$(find . -maxdepth 3 -name "*.rs" -type f -print -quit 2>/dev/null)" ]]; then
+    if [[ -f "Cargo.toml" ]] || [[ "$has_rust" == "true" ]]; then
         types+=("rust")
     fi
     
@@ -8,44 +8,33 @@ if [ -z "$FILE_PATH" ]; then
     exit 0
 fi
 
-# Format with prettier for supported file types
+# Skip files neither tool handles, or when bun is unavailable
 case "$FILE_PATH" in
-    *.ts|*.js|*.svelte|*.css|*.json|*.md)
-        if command -v bun >/dev/null 2>&1; then
-            # Find project root and run prettier from there
-            local project_root
-            project_root=$(git rev-parse --show-toplevel 2>/dev/null || dirname "$FILE_PATH")
-
-            # Convert to absolute path if relative
-            local abs_path
-            if [[ "$FILE_PATH" = /* ]]; then
-                abs_path="$FILE_PATH"
-            else
-                abs_path="$(pwd)/$FILE_PATH"
-            fi
-
-            cd "$project_root" && bun run prettier --write "$abs_path" 2>/dev/null || true
-        fi
-        ;;
+    *.ts|*.js|*.svelte|*.css|*.json|*.md) ;;
+    *) exit 0 ;;
 esac
+if ! command -v bun >/dev/null 2>&1; then
+    exit 0
+fi
+
+# Find project root once; prettier and eslint both run from there
+project_root=$(git rev-parse --show-toplevel 2>/dev/null || dirname "$FILE_PATH")
+
+# Convert to absolute path if relative
+if [[ "$FILE_PATH" = /* ]]; then
+    abs_path="$FILE_PATH"
+else
+    abs_path="$(pwd)/$FILE_PATH"
+fi
+
+cd "$project_root" || exit 0
+
+# Format with prettier for supported file types
+bun run prettier --write "$abs_path" 2>/dev/null || true
 
 # Lint with eslint for supported file types
 case "$FILE_PATH" in
     *.ts|*.js|*.svelte)
-        if command -v bun >/dev/null 2>&1; then
-            # Find project root and run eslint from there
-            local project_root
-            project_root=$(git rev-parse --show-toplevel 2>/dev/null || dirname "$FILE_PATH")
-
-            # Convert to absolute path if relative
-            local abs_path
-            if [[ "$FILE_PATH" = /* ]]; then
-                abs_path="$FILE_PATH"
-            else
-                abs_path="$(pwd)/$FILE_PATH"
-            fi
-
-            cd "$project_root" && bun run eslint --fix "$abs_path" 2>/dev/null || true
-        fi
+        bun run eslint --fix "$abs_path" 2>/dev/null || true
         ;;
-esac
\ No newline at end of file
+esac
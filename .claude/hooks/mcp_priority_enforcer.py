@@ -19,7 +19,7 @@ TOOL_REPLACEMENTS = {
 }
 
 # Tools that should never be blocked
-ALWAYS_ALLOWED = {
+ALWAYS_ALLOWED = frozenset({
     "Bash",        # System commands, git, bun
     "TodoWrite",   # Task tracking
     "Task",        # Agent delegation
@@ -29,21 +29,18 @@ ALWAYS_ALLOWED = {
     "Write",        # No serena equivalent available
     "Edit",        # Allow for JS/TS files where serena doesn't work
     "MultiEdit"    # Allow for JS/TS files where serena doesn't work
-}
+})
 
 def main():
     """Check if tool usage violates MCP priority rules."""
     try:
-        hook_data = json.loads(sys.stdin.read())
+        hook_data = json.loads(sys.stdin.buffer.read())
         tool_name = hook_data.get("tool_name", "")
 
-        # Never block always-allowed tools
-        if tool_name in ALWAYS_ALLOWED:
-            return
-
-        # Check if this tool should be replaced with MCP
-        if tool_name in TOOL_REPLACEMENTS:
-            replacement = TOOL_REPLACEMENTS[tool_name]
+        # Check if this tool should be replaced with MCP; most tools miss here,
+        # and always-allowed tools are never reminded
+        replacement = TOOL_REPLACEMENTS.get(tool_name)
+        if replacement and tool_name not in ALWAYS_ALLOWED:
             print(f"💡 Reminder: Consider using {replacement} instead of {tool_name} for better performance!", file=sys.stderr)
             # Don't block, just remind (continues execution)
             sys.exit(0)
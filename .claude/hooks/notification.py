@@ -14,6 +14,8 @@ import subprocess
 import random
 from pathlib import Path
 
+from utils.json_log import append_log_entry
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -90,29 +92,14 @@ def main():
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Ensure log directory exists
         log_dir = Path.cwd() / 'logs'
         log_dir.mkdir(parents=True, exist_ok=True)
         log_path = log_dir / 'notification.json'
         
-        # Read existing log data or initialize empty list
-        if log_path.exists():
-            with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
-        
-        # Write back to file with formatting
-        with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        append_log_entry(log_path, input_data)
         
         # Announce notification via TTS only if --notify flag is set
         # Skip TTS for the generic "Claude is waiting for your input" message
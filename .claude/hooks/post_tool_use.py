@@ -8,32 +8,20 @@ import os
 import sys
 from pathlib import Path
 
+from utils.json_log import append_log_entry
+
 def main():
     try:
         # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Ensure log directory exists
         log_dir = Path.cwd() / 'logs'
         log_dir.mkdir(parents=True, exist_ok=True)
         log_path = log_dir / 'post_tool_use.json'
         
-        # Read existing log data or initialize empty list
-        if log_path.exists():
-            with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
-        
-        # Write back to file with formatting
-        with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        # Append new data in place
+        append_log_entry(log_path, input_data)
         
         sys.exit(0)
         
@@ -10,8 +10,10 @@ import argparse
 import json
 import os
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
+
+from utils.json_log import append_log_entry
 
 try:
     from dotenv import load_dotenv
@@ -27,22 +29,7 @@ def log_pre_compact(input_data):
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / 'pre_compact.json'
     
-    # Read existing log data or initialize empty list
-    if log_file.exists():
-        with open(log_file, 'r') as f:
-            try:
-                log_data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                log_data = []
-    else:
-        log_data = []
-    
-    # Append the entire input data
-    log_data.append(input_data)
-    
-    # Write back to file with formatting
-    with open(log_file, 'w') as f:
-        json.dump(log_data, f, indent=2)
+    append_log_entry(log_file, input_data)
 
 
 def backup_transcript(transcript_path, trigger):
@@ -56,7 +43,7 @@ def backup_transcript(transcript_path, trigger):
         backup_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate backup filename with timestamp and trigger type
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         session_name = Path(transcript_path).stem
         backup_name = f"{session_name}_pre_compact_{trigger}_{timestamp}.jsonl"
         backup_path = backup_dir / backup_name
@@ -81,7 +68,7 @@ def main():
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Extract fields
         session_id = input_data.get('session_id', 'unknown')
@@ -10,9 +10,11 @@ import argparse
 import json
 import os
 import sys
-import subprocess
+import time
 from pathlib import Path
-from datetime import datetime
+
+from utils.git_status import GIT_STATUS_COMMAND, parse_git_status
+from utils.json_log import append_log_entry
 
 try:
     from dotenv import load_dotenv
@@ -20,6 +22,9 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
+# Maximum characters included from each project context file
+CONTEXT_CHAR_LIMIT = 1000
+
 
 def log_session_start(input_data):
     """Log session start event to logs directory."""
@@ -28,49 +33,27 @@ def log_session_start(input_data):
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / 'session_start.json'
     
-    # Read existing log data or initialize empty list
-    if log_file.exists():
-        with open(log_file, 'r') as f:
-            try:
-                log_data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                log_data = []
-    else:
-        log_data = []
-    
-    # Append the entire input data
-    log_data.append(input_data)
-    
-    # Write back to file with formatting
-    with open(log_file, 'w') as f:
-        json.dump(log_data, f, indent=2)
+    append_log_entry(log_file, input_data)
 
 
 def get_git_status():
     """Get current git status information."""
+    import subprocess  # Deferred: the default session start never shells out
+    
     try:
-        # Get current branch
-        branch_result = subprocess.run(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "unknown"
-        
-        # Get uncommitted changes count
+        # Branch header and uncommitted changes come from a single git call
         status_result = subprocess.run(
-            ['git', 'status', '--porcelain'],
-            capture_output=True,
-            text=True,
+            GIT_STATUS_COMMAND,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
-        if status_result.returncode == 0:
-            changes = status_result.stdout.strip().split('\n') if status_result.stdout.strip() else []
-            uncommitted_count = len(changes)
-        else:
-            uncommitted_count = 0
-        
+        if status_result.returncode != 0:
+            return "unknown", 0
+
+        current_branch, codes = parse_git_status(status_result.stdout)
+        uncommitted_count = sum(1 for _ in codes)
+
         return current_branch, uncommitted_count
     except Exception:
         return None, None
@@ -78,6 +61,8 @@ def get_git_status():
 
 def get_recent_issues():
     """Get recent GitHub issues if gh CLI is available."""
+    import subprocess
+    
     try:
         # Check if gh is available
         gh_check = subprocess.run(['which', 'gh'], capture_output=True)
@@ -98,16 +83,44 @@ def get_recent_issues():
     return None
 
 
+def read_context_head(file_path):
+    """Read only the first CONTEXT_CHAR_LIMIT characters of a file's stripped content."""
+    head = ''
+    with open(file_path, 'r') as f:
+        # Stream fixed-size chunks, dropping leading whitespace as we go
+        while len(head) < CONTEXT_CHAR_LIMIT:
+            chunk = f.read(CONTEXT_CHAR_LIMIT)
+            if not chunk:
+                break
+            head = (head + chunk).lstrip()
+
+        # Same as content.strip()[:CONTEXT_CHAR_LIMIT]: trailing whitespace is
+        # only dropped when nothing but whitespace follows it in the file
+        rest = head[CONTEXT_CHAR_LIMIT:]
+        while not rest.strip():
+            rest = f.read(CONTEXT_CHAR_LIMIT)
+            if not rest:
+                return head[:CONTEXT_CHAR_LIMIT].rstrip()
+    return head[:CONTEXT_CHAR_LIMIT]
+
+
 def load_development_context(source):
     """Load relevant development context based on session source."""
     context_parts = []
     
     # Add timestamp
-    context_parts.append(f"Session started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    context_parts.append(f"Session started at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     context_parts.append(f"Session source: {source}")
     
+    # git status and the network-bound gh query are independent, run them together
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        git_future = executor.submit(get_git_status)
+        issues_future = executor.submit(get_recent_issues)
+    branch, changes = git_future.result()
+    issues = issues_future.result()
+    
     # Add git information
-    branch, changes = get_git_status()
     if branch:
         context_parts.append(f"Git branch: {branch}")
         if changes > 0:
@@ -122,18 +135,16 @@ def load_development_context(source):
     ]
     
     for file_path in context_files:
-        if Path(file_path).exists():
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        context_parts.append(f"\n--- Content from {file_path} ---")
-                        context_parts.append(content[:1000])  # Limit to first 1000 chars
-            except Exception:
-                pass
+        # Opening is the existence check, so a missing file costs one failed open
+        try:
+            content = read_context_head(file_path)
+            if content:
+                context_parts.append(f"\n--- Content from {file_path} ---")
+                context_parts.append(content)
+        except Exception:
+            pass
     
     # Add recent issues if available
-    issues = get_recent_issues()
     if issues:
         context_parts.append("\n--- Recent GitHub Issues ---")
         context_parts.append(issues)
@@ -152,7 +163,7 @@ def main():
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Extract fields
         session_id = input_data.get('session_id', 'unknown')
@@ -178,6 +189,8 @@ def main():
         # Announce session start if requested
         if args.announce:
             try:
+                import subprocess
+                
                 # Try to use TTS to announce session start
                 script_dir = Path(__file__).parent
                 tts_script = script_dir / "utils" / "tts" / "pyttsx3_tts.py"
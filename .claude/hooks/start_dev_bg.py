@@ -9,6 +9,7 @@
 import argparse
 import json
 import os
+import signal
 import sys
 import subprocess
 import time
@@ -20,14 +21,42 @@ except ImportError:
     psutil = None
 
 
+def iter_listening_pids(port):
+    """Yield the PID of each TCP listener on the port (psutil only)."""
+    # Only TCP sockets can LISTEN, so skip parsing the UDP and UNIX tables
+    for conn in psutil.net_connections(kind='tcp'):
+        if conn.laddr and conn.laddr.port == port and conn.status == 'LISTEN':
+            yield conn.pid
+
+
+def is_port_bindable(port):
+    """Cheap probe: True only when nothing is bound to the port on IPv4 or IPv6."""
+    import errno
+    import socket
+
+    for family, address in ((socket.AF_INET, '0.0.0.0'), (socket.AF_INET6, '::')):
+        try:
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                if family == socket.AF_INET6:
+                    # Probe IPv6 on its own; IPv4 was covered above
+                    sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+                sock.bind((address, port))
+        except OSError as e:
+            if e.errno == errno.EAFNOSUPPORT:
+                continue  # No IPv6 on this host, so nothing can listen there
+            return False  # Bound, or can't tell: leave it to the full check
+    return True
+
+
 def is_port_in_use(port):
     """Check if a port is already in use."""
+    # A free port binds at once; only a busy one needs the socket table walk
+    if is_port_bindable(port):
+        return False
+
     if psutil:
         # Use psutil if available (more reliable)
-        for conn in psutil.net_connections():
-            if conn.laddr.port == port and conn.status == 'LISTEN':
-                return True
-        return False
+        return next(iter_listening_pids(port), None) is not None
     else:
         # Fallback to lsof command
         try:
@@ -46,19 +75,21 @@ def kill_processes_on_port(port):
     killed_pids = []
 
     if psutil:
-        # Use psutil if available (more reliable)
-        for proc in psutil.process_iter(['pid', 'name']):
+        # Use psutil if available (more reliable); one socket table scan finds the
+        # listeners instead of querying the connections of every process.
+        # A process listening on IPv4 and IPv6 shows up twice, dedupe in order
+        for pid in dict.fromkeys(iter_listening_pids(port)):
+            if pid is None:
+                continue  # Socket owned by a process we can't see
             try:
-                for conn in proc.connections():
-                    if conn.laddr.port == port and conn.status == 'LISTEN':
-                        proc.terminate()
-                        killed_pids.append(proc.pid)
-                        # Wait a moment then force kill if needed
-                        try:
-                            proc.wait(timeout=2)
-                        except psutil.TimeoutExpired:
-                            proc.kill()
-                        break
+                proc = psutil.Process(pid)
+                proc.terminate()
+                killed_pids.append(pid)
+                # Wait a moment then force kill if needed
+                try:
+                    proc.wait(timeout=2)
+                except psutil.TimeoutExpired:
+                    proc.kill()
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
     else:
@@ -72,16 +103,24 @@ def kill_processes_on_port(port):
                 timeout=3
             )
             if result.returncode == 0 and result.stdout.strip():
-                pids = result.stdout.strip().split('\n')
+                # A PID can be listed once per socket (IPv4 + IPv6), dedupe in order
+                pids = list(dict.fromkeys(result.stdout.split()))
+                # SIGTERM every process first so they all share one grace period
                 for pid in pids:
                     try:
-                        subprocess.run(['kill', '-15', pid], timeout=2)  # SIGTERM first
+                        os.kill(int(pid), signal.SIGTERM)
                         killed_pids.append(int(pid))
-                        time.sleep(1)
-                        # Force kill if still running
-                        subprocess.run(['kill', '-9', pid], timeout=1, stderr=subprocess.DEVNULL)
-                    except (subprocess.TimeoutExpired, ValueError):
+                    except (ValueError, OSError):
                         continue
+
+                if killed_pids:
+                    time.sleep(1)
+                    # Force kill any that are still running
+                    for pid in killed_pids:
+                        try:
+                            os.kill(pid, signal.SIGKILL)
+                        except OSError:
+                            pass  # Already exited
         except Exception:
             pass
 
@@ -168,7 +207,7 @@ def main():
 
         # Read JSON input from stdin if provided
         try:
-            input_data = json.loads(sys.stdin.read())
+            input_data = json.loads(sys.stdin.buffer.read())
         except (json.JSONDecodeError, EOFError):
             input_data = {}
 
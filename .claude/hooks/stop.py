@@ -10,10 +10,9 @@ import argparse
 import json
 import os
 import sys
-import random
-import subprocess
 from pathlib import Path
-from datetime import datetime
+
+from utils.json_log import append_log_entry
 
 try:
     from dotenv import load_dotenv
@@ -67,6 +66,8 @@ def get_llm_completion_message():
     Generate completion message using available LLM services.
     Fallback to random message if no LLM available.
     """
+    import random  # Deferred: only the --notify path picks a message
+
     # Fallback to random predefined message
     messages = get_completion_messages()
     return random.choice(messages)
@@ -74,6 +75,8 @@ def get_llm_completion_message():
 
 def announce_completion():
     """Announce completion using the best available TTS service."""
+    import subprocess  # Deferred: only the --notify path spawns TTS
+    
     try:
         tts_script = get_tts_script_path()
         if not tts_script:
@@ -107,29 +110,14 @@ def main():
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Ensure log directory exists
         log_dir = Path("logs")
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / 'stop.json'
         
-        # Read existing log data or initialize empty list
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
-        
-        # Write back to file with formatting
-        with open(log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        append_log_entry(log_file, input_data)
         
         # Copy chat transcript if requested and available
         if args.chat:
@@ -12,7 +12,8 @@ import os
 import sys
 import subprocess
 from pathlib import Path
-from datetime import datetime
+
+from utils.json_log import append_log_entry
 
 try:
     from dotenv import load_dotenv
@@ -85,7 +86,7 @@ def main():
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
 
         # Extract required fields
         session_id = input_data.get("session_id", "")
@@ -96,22 +97,7 @@ def main():
         log_dir.mkdir(parents=True, exist_ok=True)
         log_path = log_dir / "subagent_stop.json"
 
-        # Read existing log data or initialize empty list
-        if log_path.exists():
-            with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
-        
-        # Write back to file with formatting
-        with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        append_log_entry(log_path, input_data)
         
         # Handle --chat switch (same as stop.py)
         if args.chat and 'transcript_path' in input_data:
@@ -9,9 +9,11 @@
 import argparse
 import json
 import os
+import re
 import sys
 from pathlib import Path
-from datetime import datetime
+
+from utils.json_log import append_log_entry
 
 try:
     from dotenv import load_dotenv
@@ -19,6 +21,25 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
+# How json.dump(..., indent=2) ends a session file with at least one prompt
+SESSION_FILE_TAIL = '\n  ]\n}'
+
+# Example validation rules (customize as needed)
+BLOCKED_PROMPT_PATTERNS = [
+    # Add any patterns you want to block
+    # Example: ('rm -rf /', 'Dangerous command detected'),
+]
+
+# All blocked patterns as one case-insensitive alternation, scanned once per prompt;
+# zero-width so overlapping hits are all seen, group "p<N>" is pattern N
+BLOCKED_PROMPT_PATTERN = re.compile(
+    '(?=' + '|'.join(
+        f'(?P<p{index}>{re.escape(pattern)})'
+        for index, (pattern, _) in enumerate(BLOCKED_PROMPT_PATTERNS)
+    ) + ')',
+    re.IGNORECASE
+) if BLOCKED_PROMPT_PATTERNS else None
+
 
 def log_user_prompt(session_id, input_data):
     """Log user prompt to logs directory."""
@@ -27,22 +48,7 @@ def log_user_prompt(session_id, input_data):
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / 'user_prompt_submit.json'
     
-    # Read existing log data or initialize empty list
-    if log_file.exists():
-        with open(log_file, 'r') as f:
-            try:
-                log_data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                log_data = []
-    else:
-        log_data = []
-    
-    # Append the entire input data
-    log_data.append(input_data)
-    
-    # Write back to file with formatting
-    with open(log_file, 'w') as f:
-        json.dump(log_data, f, indent=2)
+    append_log_entry(log_file, input_data)
 
 
 def manage_session_data(session_id, prompt, name_agent=False):
@@ -54,6 +60,24 @@ def manage_session_data(session_id, prompt, name_agent=False):
     # Load or create session file
     session_file = sessions_dir / f"{session_id}.json"
     
+    # Fast path: splice the prompt in before the prompts array's closing bracket
+    tail = SESSION_FILE_TAIL.encode()
+    try:
+        with open(session_file, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size > len(tail):
+                f.seek(size - len(tail))
+                if f.read() == tail:
+                    # The prompt laid out exactly as a nested json.dump would
+                    nested = json.dumps({"prompts": [prompt]}, indent=2)
+                    item = nested[nested.index('[\n') + 2:-len(SESSION_FILE_TAIL)]
+                    f.seek(size - len(tail))
+                    f.write(f",\n{item}{SESSION_FILE_TAIL}".encode())
+                    return
+    except FileNotFoundError:
+        pass
+    
+    # New, empty or unrecognised session file: load it and rewrite it whole
     if session_file.exists():
         try:
             with open(session_file, 'r') as f:
@@ -80,18 +104,19 @@ def validate_prompt(prompt):
     Validate the user prompt for security or policy violations.
     Returns tuple (is_valid, reason).
     """
-    # Example validation rules (customize as needed)
-    blocked_patterns = [
-        # Add any patterns you want to block
-        # Example: ('rm -rf /', 'Dangerous command detected'),
-    ]
-    
-    prompt_lower = prompt.lower()
+    if BLOCKED_PROMPT_PATTERN is None:
+        return True, None
     
-    for pattern, reason in blocked_patterns:
-        if pattern.lower() in prompt_lower:
-            return False, reason
+    # Report the first listed pattern found anywhere, as rules are ordered;
+    # matching is case-insensitive, so the prompt is never copied lowercased
+    first = len(BLOCKED_PROMPT_PATTERNS)
+    for match in BLOCKED_PROMPT_PATTERN.finditer(prompt):
+        first = min(first, int(match.lastgroup[1:]))
+        if first == 0:
+            break
     
+    if first < len(BLOCKED_PROMPT_PATTERNS):
+        return False, BLOCKED_PROMPT_PATTERNS[first][1]
     return True, None
 
 
@@ -110,7 +135,7 @@ def main():
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Extract relevant data
         session_id = input_data.get('sessionId', 'unknown')
@@ -0,0 +1,40 @@
+"""Parsing for `git status --porcelain=v1 -z --branch` output."""
+
+# Branch header plus NUL-terminated records: paths come through unquoted and
+# a newline in a filename can't be mistaken for another entry
+GIT_STATUS_COMMAND = ('git', 'status', '--porcelain=v1', '-z', '--branch', '--untracked-files=normal')
+
+
+def parse_branch_header(header):
+    """Extract the branch name from a `git status --branch` header record."""
+    branch = header[3:]  # Strip the leading "## "
+
+    if branch.startswith("No commits yet on "):
+        return branch[len("No commits yet on "):]
+    if branch.startswith("HEAD (no branch)"):
+        return "HEAD"  # Detached HEAD, same as rev-parse --abbrev-ref
+
+    # "main...origin/main [ahead 1]" -> "main"
+    return branch.split("...", 1)[0].split(" ", 1)[0]
+
+
+def parse_git_status(output):
+    """Split raw GIT_STATUS_COMMAND output into the branch and an iterator of XY codes.
+
+    Only the branch header is decoded; paths are never looked at.
+    """
+    records = output.split(b'\0')
+    branch = "unknown"
+    if records[0].startswith(b'## '):
+        branch = parse_branch_header(records.pop(0).decode('utf-8', errors='replace'))
+    return branch, _iter_status_codes(records)
+
+
+def _iter_status_codes(records):
+    records = iter(records)
+    for record in records:
+        if not record:
+            continue
+        yield record[:2]
+        if record[:1] in (b'R', b'C'):
+            next(records, None)  # Skip the rename/copy source path
@@ -0,0 +1,35 @@
+"""Helpers for the JSON array logs the hooks and status lines write."""
+
+import json
+import os
+
+
+def append_log_entry(log_path, entry):
+    """Append entry to a JSON array log without re-reading the whole file."""
+    # Same layout json.dump(..., indent=2) gives a list element
+    item = json.dumps([entry], indent=2)[2:-2]
+
+    # Fast path: splice the entry in before the closing bracket
+    try:
+        with open(log_path, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size > 2:
+                f.seek(size - 2)
+                if f.read() == b'\n]':
+                    f.seek(size - 2)
+                    f.write(f",\n{item}\n]".encode())
+                    return
+    except FileNotFoundError:
+        pass
+
+    # Missing, empty or unrecognised log: fall back to a full rewrite
+    log_data = []
+    if log_path.exists():
+        with open(log_path, 'r') as f:
+            try:
+                log_data = json.load(f)
+            except (json.JSONDecodeError, ValueError):
+                log_data = []
+    log_data.append(entry)
+    with open(log_path, 'w') as f:
+        json.dump(log_data, f, indent=2)
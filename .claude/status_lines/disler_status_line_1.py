@@ -14,6 +14,8 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from status_line_utils import GIT_STATUS_COMMAND, append_log_entry, parse_git_status
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -28,66 +30,53 @@ def log_status_line_event(input_data):
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / 'status_line.json'
     
-    # Read existing log data or initialize empty list
-    if log_file.exists():
-        with open(log_file, 'r') as f:
-            try:
-                log_data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                log_data = []
-    else:
-        log_data = []
-    
     # Add timestamp to input data
     log_entry = {
         "timestamp": datetime.now().isoformat(),
         "data": input_data
     }
     
-    # Append the log entry
-    log_data.append(log_entry)
-    
-    # Write back to file with formatting
-    with open(log_file, 'w') as f:
-        json.dump(log_data, f, indent=2)
+    append_log_entry(log_file, log_entry)
 
 
 def get_git_info():
     """Get current git branch and status."""
     try:
-        # Get current branch
-        branch_result = subprocess.run(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "unknown"
-        
-        # Get status
+        # Branch header and status come from a single git call
         status_result = subprocess.run(
-            ['git', 'status', '--porcelain'],
-            capture_output=True,
-            text=True,
+            GIT_STATUS_COMMAND,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
         
-        if status_result.returncode == 0:
-            status_lines = status_result.stdout.strip().split('\n') if status_result.stdout.strip() else []
-            if status_lines:
-                # Determine status symbol
-                if any(line.startswith('??') for line in status_lines):
-                    status_symbol = "🆕"  # Untracked files
-                elif any(line.startswith(' M') for line in status_lines):
-                    status_symbol = "📝"  # Modified files
-                elif any(line.startswith('M ') for line in status_lines):
-                    status_symbol = "📋"  # Staged files
-                else:
-                    status_symbol = "🔄"  # Other changes
-            else:
-                status_symbol = "✅"  # Clean
+        if status_result.returncode != 0:
+            return "unknown", "❓"  # Unknown
+        
+        current_branch, codes = parse_git_status(status_result.stdout)
+        
+        # Determine status symbol in a single pass over the records
+        has_changes = has_untracked = has_modified = has_staged = False
+        for code in codes:
+            has_changes = True
+            if code == b'??':
+                has_untracked = True
+                break  # Highest priority, nothing else can win
+            elif code == b' M':
+                has_modified = True
+            elif code == b'M ':
+                has_staged = True
+
+        if not has_changes:
+            status_symbol = "✅"  # Clean
+        elif has_untracked:
+            status_symbol = "🆕"  # Untracked files
+        elif has_modified:
+            status_symbol = "📝"  # Modified files
+        elif has_staged:
+            status_symbol = "📋"  # Staged files
         else:
-            status_symbol = "❓"  # Unknown
+            status_symbol = "🔄"  # Other changes
         
         return current_branch, status_symbol
     except Exception:
@@ -103,7 +92,7 @@ def get_workspace_info():
 def main():
     try:
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Log the status line event
         log_status_line_event(input_data)
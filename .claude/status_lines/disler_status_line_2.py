@@ -14,12 +14,31 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from status_line_utils import (
+    append_log_entry,
+    compile_keyword_rules,
+    find_first_rule,
+    iter_lines_reversed,
+)
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
 except ImportError:
     pass  # dotenv is optional
 
+# Prompt icons and colors in priority order, each with the keywords that select it
+PROMPT_ICON_RULES = (
+    ("💻", "\033[32m", ('code', 'function', 'class', 'debug', 'fix', 'implement')),  # Coding, green
+    ("📁", "\033[34m", ('file', 'read', 'write', 'create', 'delete')),  # File operations, blue
+    ("🔍", "\033[33m", ('analyze', 'research', 'explain', 'understand', 'what')),  # Analysis, yellow
+    ("📝", "\033[36m", ('document', 'comment', 'readme', 'docs')),  # Documentation, cyan
+    ("🧪", "\033[35m", ('test', 'spec', 'unit', 'integration')),  # Testing, magenta
+    ("🔀", "\033[31m", ('git', 'commit', 'push', 'pull', 'merge')),  # Git operations, red
+)
+
+PROMPT_ICON_PATTERN = compile_keyword_rules(words for _, _, words in PROMPT_ICON_RULES)
+
 
 def log_status_line_event(input_data):
     """Log status line event to logs directory."""
@@ -28,28 +47,13 @@ def log_status_line_event(input_data):
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / 'status_line_v2.json'
     
-    # Read existing log data or initialize empty list
-    if log_file.exists():
-        with open(log_file, 'r') as f:
-            try:
-                log_data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                log_data = []
-    else:
-        log_data = []
-    
     # Add timestamp to input data
     log_entry = {
         "timestamp": datetime.now().isoformat(),
         "data": input_data
     }
     
-    # Append the log entry
-    log_data.append(log_entry)
-    
-    # Write back to file with formatting
-    with open(log_file, 'w') as f:
-        json.dump(log_data, f, indent=2)
+    append_log_entry(log_file, log_entry)
 
 
 def get_last_prompt_from_session(session_id):
@@ -61,23 +65,27 @@ def get_last_prompt_from_session(session_id):
         if not session_file.exists():
             return "No session file"
         
-        # Read the last line that contains a user prompt
+        # Scan from the end and stop at the last line that contains a user prompt
         last_prompt = "No prompts found"
-        with open(session_file, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get('type') == 'user' and entry.get('content'):
-                        content = entry['content']
-                        if isinstance(content, list) and len(content) > 0:
-                            # Get text from content array
-                            text_parts = [item.get('text', '') for item in content if item.get('type') == 'text']
-                            if text_parts:
-                                last_prompt = ' '.join(text_parts)
-                        elif isinstance(content, str):
-                            last_prompt = content
-                except json.JSONDecodeError:
-                    continue
+        for line in iter_lines_reversed(session_file):
+            # Every user entry carries a literal "user"; skip parsing the rest
+            if b'"user"' not in line:
+                continue
+            try:
+                entry = json.loads(line)
+                if entry.get('type') == 'user' and entry.get('content'):
+                    content = entry['content']
+                    if isinstance(content, list) and len(content) > 0:
+                        # Get text from content array
+                        text_parts = [item.get('text', '') for item in content if item.get('type') == 'text']
+                        if text_parts:
+                            last_prompt = ' '.join(text_parts)
+                            break
+                    elif isinstance(content, str):
+                        last_prompt = content
+                        break
+            except json.JSONDecodeError:
+                continue
         
         return last_prompt[:50] + "..." if len(last_prompt) > 50 else last_prompt
     except Exception:
@@ -86,41 +94,18 @@ def get_last_prompt_from_session(session_id):
 
 def get_prompt_icon_and_color(prompt_text):
     """Determine icon and color based on prompt content."""
-    prompt_lower = prompt_text.lower()
-    
-    # Coding related
-    if any(word in prompt_lower for word in ['code', 'function', 'class', 'debug', 'fix', 'implement']):
-        return "💻", "\033[32m"  # Green
-    
-    # File operations
-    elif any(word in prompt_lower for word in ['file', 'read', 'write', 'create', 'delete']):
-        return "📁", "\033[34m"  # Blue
-    
-    # Analysis/research
-    elif any(word in prompt_lower for word in ['analyze', 'research', 'explain', 'understand', 'what']):
-        return "🔍", "\033[33m"  # Yellow
-    
-    # Documentation
-    elif any(word in prompt_lower for word in ['document', 'comment', 'readme', 'docs']):
-        return "📝", "\033[36m"  # Cyan
-    
-    # Testing
-    elif any(word in prompt_lower for word in ['test', 'spec', 'unit', 'integration']):
-        return "🧪", "\033[35m"  # Magenta
-    
-    # Git operations
-    elif any(word in prompt_lower for word in ['git', 'commit', 'push', 'pull', 'merge']):
-        return "🔀", "\033[31m"  # Red
+    rule = find_first_rule(PROMPT_ICON_PATTERN, prompt_text)
+    if rule is not None:
+        return PROMPT_ICON_RULES[rule][:2]
     
     # Default
-    else:
-        return "💬", "\033[37m"  # White
+    return "💬", "\033[37m"  # White
 
 
 def main():
     try:
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Log the status line event
         log_status_line_event(input_data)
@@ -14,12 +14,31 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from status_line_utils import (
+    append_log_entry,
+    compile_keyword_rules,
+    find_first_rule,
+    iter_lines_reversed,
+)
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
 except ImportError:
     pass  # dotenv is optional
 
+# Prompt icons in priority order, each with the keywords that select it
+PROMPT_ICON_RULES = (
+    ("💻", ('code', 'function', 'class', 'debug')),
+    ("📁", ('file', 'read', 'write', 'create')),
+    ("🔍", ('analyze', 'research', 'explain')),
+    ("🧪", ('test', 'spec', 'unit')),
+    ("🔀", ('git', 'commit', 'push')),
+    ("🔧", ('fix', 'bug', 'error')),
+)
+
+PROMPT_ICON_PATTERN = compile_keyword_rules(words for _, words in PROMPT_ICON_RULES)
+
 
 def log_status_line_event(input_data):
     """Log status line event to logs directory."""
@@ -28,28 +47,13 @@ def log_status_line_event(input_data):
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / 'status_line_v3.json'
     
-    # Read existing log data or initialize empty list
-    if log_file.exists():
-        with open(log_file, 'r') as f:
-            try:
-                log_data = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                log_data = []
-    else:
-        log_data = []
-    
     # Add timestamp to input data
     log_entry = {
         "timestamp": datetime.now().isoformat(),
         "data": input_data
     }
     
-    # Append the log entry
-    log_data.append(log_entry)
-    
-    # Write back to file with formatting
-    with open(log_file, 'w') as f:
-        json.dump(log_data, f, indent=2)
+    append_log_entry(log_file, log_entry)
 
 
 def get_agent_name():
@@ -83,29 +87,33 @@ def get_recent_prompts_summary(session_id, max_prompts=3):
         if not session_file.exists():
             return "No session"
         
-        prompts = []
-        with open(session_file, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get('type') == 'user' and entry.get('content'):
-                        content = entry['content']
-                        if isinstance(content, list) and len(content) > 0:
-                            # Get text from content array
-                            text_parts = [item.get('text', '') for item in content if item.get('type') == 'text']
-                            if text_parts:
-                                prompt_text = ' '.join(text_parts)
-                                prompts.append(prompt_text)
-                        elif isinstance(content, str):
-                            prompts.append(content)
-                except json.JSONDecodeError:
-                    continue
+        # Collect only the last few prompts, scanning from the end of the file
+        recent_prompts = []
+        for line in iter_lines_reversed(session_file):
+            if len(recent_prompts) >= max_prompts:
+                break
+            # Every user entry carries a literal "user"; skip parsing the rest
+            if b'"user"' not in line:
+                continue
+            try:
+                entry = json.loads(line)
+                if entry.get('type') == 'user' and entry.get('content'):
+                    content = entry['content']
+                    if isinstance(content, list) and len(content) > 0:
+                        # Get text from content array
+                        text_parts = [item.get('text', '') for item in content if item.get('type') == 'text']
+                        if text_parts:
+                            prompt_text = ' '.join(text_parts)
+                            recent_prompts.append(prompt_text)
+                    elif isinstance(content, str):
+                        recent_prompts.append(content)
+            except json.JSONDecodeError:
+                continue
         
-        if not prompts:
+        if not recent_prompts:
             return "No prompts"
         
-        # Get the last few prompts
-        recent_prompts = prompts[-max_prompts:]
+        recent_prompts.reverse()  # Oldest first
         
         # Truncate and add icons
         formatted_prompts = []
@@ -122,28 +130,16 @@ def get_recent_prompts_summary(session_id, max_prompts=3):
 
 def get_prompt_icon(prompt_text):
     """Get an icon for the prompt based on its content."""
-    prompt_lower = prompt_text.lower()
-    
-    if any(word in prompt_lower for word in ['code', 'function', 'class', 'debug']):
-        return "💻"
-    elif any(word in prompt_lower for word in ['file', 'read', 'write', 'create']):
-        return "📁"
-    elif any(word in prompt_lower for word in ['analyze', 'research', 'explain']):
-        return "🔍"
-    elif any(word in prompt_lower for word in ['test', 'spec', 'unit']):
-        return "🧪"
-    elif any(word in prompt_lower for word in ['git', 'commit', 'push']):
-        return "🔀"
-    elif any(word in prompt_lower for word in ['fix', 'bug', 'error']):
-        return "🔧"
-    else:
-        return "💬"
+    rule = find_first_rule(PROMPT_ICON_PATTERN, prompt_text)
+    if rule is not None:
+        return PROMPT_ICON_RULES[rule][0]
+    return "💬"
 
 
 def main():
     try:
         # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(sys.stdin.buffer.read())
         
         # Log the status line event
         log_status_line_event(input_data)
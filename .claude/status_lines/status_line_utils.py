@@ -0,0 +1,72 @@
+"""Helpers shared by the status line scripts."""
+
+import re
+import sys
+from pathlib import Path
+
+# The JSON log and git status helpers live with the hooks; re-exported for
+# the status lines
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "hooks"))
+from utils.git_status import GIT_STATUS_COMMAND, parse_git_status
+from utils.json_log import append_log_entry
+
+# Prompt icons in priority order, each with the keywords that select it
+PROMPT_ICON_RULES = (
+    ("💻", ("code", "function", "class", "debug", "implement")),
+    ("📁", ("file", "read", "write", "create", "delete")),
+    ("🔍", ("analyze", "research", "explain", "understand")),
+    ("📝", ("document", "comment", "readme", "docs")),
+    ("🧪", ("test", "spec", "unit", "integration")),
+    ("🔀", ("git", "commit", "push", "pull", "merge")),
+    ("🔧", ("fix", "bug", "error", "issue")),
+    ("🚀", ("deploy", "build", "release")),
+    ("🔒", ("security", "auth", "password")),
+    ("⚡", ("performance", "optimize", "speed")),
+)
+
+
+def compile_keyword_rules(keyword_sets):
+    """Compile keyword sets, in priority order, into one case-insensitive pattern."""
+    # Zero-width lookahead so overlapping keywords are all seen; group "c<N>" is set N
+    return re.compile(
+        "(?=" + "|".join(
+            f"(?P<c{priority}>{'|'.join(words)})"
+            for priority, words in enumerate(keyword_sets)
+        ) + ")",
+        re.IGNORECASE
+    )
+
+
+def find_first_rule(pattern, text):
+    """Return the index of the highest-priority keyword set in text, or None."""
+    # Every keyword hit is found in one scan of the original text, with no
+    # lowercased copy; the lowest index wins
+    best = None
+    for match in pattern.finditer(text):
+        priority = int(match.lastgroup[1:])
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+    return best
+
+
+def iter_lines_reversed(file_path):
+    """Yield a file's lines as bytes, last line first, sliced out of a memory map."""
+    import mmap  # Deferred: only needed when a session transcript is scanned
+    
+    with open(file_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b''  # Empty files can't be mapped
+            return
+        with mapped:
+            # Only the lines actually visited are copied out of the page cache
+            end = len(mapped)
+            while True:
+                start = mapped.rfind(b'\n', 0, end) + 1
+                yield mapped[start:end]
+                if start == 0:
+                    break
+                end = start - 1
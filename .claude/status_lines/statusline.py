@@ -5,104 +5,303 @@ import sys
 import json
 import subprocess
 import os
+import re
+import tempfile
+import time
 from pathlib import Path
 
+from status_line_utils import (
+    PROMPT_ICON_RULES,
+    compile_keyword_rules,
+    find_first_rule,
+    iter_lines_reversed,
+)
 
-def get_git_info():
-    """Get current git branch and last commit time."""
+
+# Hook messages and system content that should never show up as the last prompt
+SYSTEM_CONTENT_PATTERN = re.compile(
+    r"edit operation feedback|\.claude/hooks/|user-prompt-submit-hook|critical: always follow",
+    re.IGNORECASE
+)
+
+# git relative-date units and their compact forms; plurals first so they match first
+COMMIT_AGE_UNITS = {
+    "seconds": "s", "second": "s",
+    "minutes": "m", "minute": "m",
+    "hours": "h", "hour": "h",
+    "days": "d", "day": "d",
+    "weeks": "w", "week": "w",
+    "months": "mo", "month": "mo",
+}
+
+# Generated from the table above; a bare " ago" has no unit group and is dropped
+COMMIT_AGE_PATTERN = re.compile(" (" + "|".join(COMMIT_AGE_UNITS) + ")| ago")
+
+# Keyword lookahead over the shared prompt icon table
+PROMPT_ICON_PATTERN = compile_keyword_rules(words for _, words in PROMPT_ICON_RULES)
+
+# ccusage statusline fields: "🧠 12,345 (6%)" and "(2h 9m left)"
+CCUSAGE_TOKENS_PATTERN = re.compile(r'🧠\s*([\d,]+)\s*\((\d+)%\)')
+CCUSAGE_TIME_LEFT_PATTERN = re.compile(r'\((\d+)h\s*(\d+)m\s*left\)')
+
+# ccusage results keyed by transcript path, mtime and size; per user, since the
+# temp dir is shared
+CCUSAGE_CACHE_PATH = Path(tempfile.gettempdir()) / f"claude-statusline-ccusage-{os.getuid()}.json"
+
+# Last git branch/commit age, keyed by repository and HEAD/reflog mtimes; per user
+GIT_INFO_CACHE_PATH = Path(tempfile.gettempdir()) / f"claude-statusline-git-{os.getuid()}.json"
+GIT_INFO_CACHE_TTL = 5  # seconds
+
+
+def write_cache_file(path, data):
+    """Write data to a JSON cache file through a private temp file and an atomic rename."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
     try:
-        # Check if we're in a git repo
-        subprocess.run(
-            ["git", "rev-parse", "--git-dir"], 
-            check=True, 
-            capture_output=True, 
-            cwd="."
-        )
-        
-        # Get current branch
-        branch_result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            cwd="."
-        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def find_git_dir():
+    """Find the enclosing .git entry (dir, or file for worktrees) without spawning git."""
+    if os.environ.get("GIT_DIR"):
+        return Path(os.environ["GIT_DIR"])
+    
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        git_path = directory / ".git"
+        if git_path.exists():
+            return git_path
+    return None
+
+
+def read_head(git_dir):
+    """Read HEAD once for both the branch and the commit lookups, or None if it can't be."""
+    try:
+        with open(git_dir / "HEAD") as f:
+            return f.read().strip()
+    except OSError:
+        return None  # Worktree .git file and the like, ask git instead
+
+
+def read_current_branch(head):
+    """
+    Get the checked-out branch from HEAD's contents, like `git branch --show-current`.
+    Returns "" when HEAD is detached and None when HEAD couldn't be read directly.
+    """
+    if head is None:
+        return None
+    
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    return ""
+
+
+def read_head_commit_time(git_dir, head):
+    """
+    Read the author timestamp of the HEAD commit from its loose object.
+    Returns None whenever git has to answer instead (packed refs or objects, worktrees).
+    """
+    import zlib  # Deferred: only needed on a git info cache miss
+    
+    if head is None:
+        return None
+    
+    try:
+        if head.startswith("ref: "):
+            ref = head[len("ref: "):]
+            try:
+                with open(git_dir / ref) as f:
+                    sha = f.read().strip()
+            except FileNotFoundError:
+                return None  # Packed ref or unborn branch
+        else:
+            sha = head  # Detached HEAD
         
-        branch = ""
-        if branch_result.returncode == 0 and branch_result.stdout.strip():
-            branch = branch_result.stdout.strip()
+        with open(git_dir / "objects" / sha[:2] / sha[2:], "rb") as f:
+            commit = zlib.decompress(f.read())
+    except (OSError, zlib.error):
+        return None
+    
+    # Header "commit <size>\0", then "tree", "parent"... and "author Name <email> <ts> <tz>"
+    for line in commit.split(b"\0", 1)[-1].split(b"\n"):
+        if line.startswith(b"author "):
+            try:
+                return int(line.rsplit(b" ", 2)[1])
+            except (IndexError, ValueError):
+                return None
+        if not line:
+            break  # End of headers
+    return None
+
+
+def format_git_relative_date(timestamp, now=None):
+    """Format a timestamp exactly like git's relative dates (`--format=%ar`)."""
+    def plural(count, unit):
+        return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
+    
+    now = int(time.time()) if now is None else now
+    if now < timestamp:
+        return "in the future"
+    
+    # Same thresholds and rounding as show_date_relative() in git's date.c
+    diff = now - timestamp
+    if diff < 90:
+        return f"{plural(diff, 'second')} ago"
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return f"{plural(diff, 'minute')} ago"
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return f"{plural(diff, 'hour')} ago"
+    diff = (diff + 12) // 24
+    if diff < 14:
+        return f"{plural(diff, 'day')} ago"
+    if diff < 70:
+        return f"{plural((diff + 3) // 7, 'week')} ago"
+    if diff < 365:
+        return f"{plural((diff + 15) // 30, 'month')} ago"
+    if diff < 1825:
+        total_months = (diff * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            return f"{plural(years, 'year')}, {plural(months, 'month')} ago"
+        return f"{plural(years, 'year')} ago"
+    return f"{plural((diff + 183) // 365, 'year')} ago"
+
+
+def get_git_info():
+    """
+    Get current git branch and last commit time.
+    The result is cached until HEAD or its reflog changes (checkout, commit, reset),
+    with a short TTL so the relative commit age keeps advancing.
+    """
+    # Outside a repository a few stats are much cheaper than a failing git process
+    git_dir = find_git_dir()
+    if git_dir is None:
+        return ""
+    
+    cache_key = None
+    try:
+        cache_key = [
+            str(git_dir.resolve()),
+            os.stat(git_dir / "HEAD").st_mtime_ns,
+            os.stat(git_dir / "logs" / "HEAD").st_mtime_ns,
+        ]
+    except OSError:
+        pass  # Worktree .git file or no reflog, always query git
+    
+    if cache_key:
+        try:
+            with open(GIT_INFO_CACHE_PATH) as f:
+                cached = json.load(f)
+            if cached.get("key") == cache_key and time.time() - cached["time"] < GIT_INFO_CACHE_TTL:
+                return cached["git_info"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # Missing, stale or unreadable cache, ask git
+    
+    git_info = ""
+    try:
+        # Get current branch, straight from HEAD when it's a plain file
+        head = read_head(git_dir)
+        branch = read_current_branch(head)
+        if branch is None:
+            branch_result = subprocess.run(
+                ["git", "branch", "--show-current"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,  # Never read, so never captured
+                text=True
+            )
+            
+            branch = ""
+            if branch_result.returncode == 0 and branch_result.stdout.strip():
+                branch = branch_result.stdout.strip()
         
-        # Get last commit time
-        commit_result = subprocess.run(
-            ["git", "log", "-1", "--format=%ar"],
-            capture_output=True,
-            text=True,
-            cwd="."
-        )
+        # Get last commit time, from the loose HEAD commit when there is one
+        commit_age = ""
+        commit_timestamp = read_head_commit_time(git_dir, head)
+        if commit_timestamp is not None:
+            commit_age = format_git_relative_date(commit_timestamp)
+        else:
+            commit_result = subprocess.run(
+                ["git", "log", "-1", "--format=%ar"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            if commit_result.returncode == 0:
+                commit_age = commit_result.stdout.strip()
         
         commit_time = ""
-        if commit_result.returncode == 0 and commit_result.stdout.strip():
-            # Simplify time format
-            time_str = commit_result.stdout.strip()
-            time_str = time_str.replace(" ago", "")
-            time_str = time_str.replace(" seconds", "s")
-            time_str = time_str.replace(" second", "s")
-            time_str = time_str.replace(" minutes", "m")
-            time_str = time_str.replace(" minute", "m")
-            time_str = time_str.replace(" hours", "h")
-            time_str = time_str.replace(" hour", "h")
-            time_str = time_str.replace(" days", "d")
-            time_str = time_str.replace(" day", "d")
-            time_str = time_str.replace(" weeks", "w")
-            time_str = time_str.replace(" week", "w")
-            time_str = time_str.replace(" months", "mo")
-            time_str = time_str.replace(" month", "mo")
-            commit_time = time_str
+        if commit_age:
+            # Simplify time format ("5 minutes ago" -> "5m") in one pass
+            commit_time = COMMIT_AGE_PATTERN.sub(
+                lambda m: COMMIT_AGE_UNITS.get(m.group(1), ""),
+                commit_age
+            )
         
         if branch and commit_time:
-            return f" ({branch}, {commit_time})"
+            git_info = f" ({branch}, {commit_time})"
         elif branch:
-            return f" ({branch})"
+            git_info = f" ({branch})"
         
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+    except FileNotFoundError:
+        return ""  # git isn't installed; don't cache failures
     
-    return ""
+    if cache_key:
+        try:
+            write_cache_file(
+                GIT_INFO_CACHE_PATH,
+                {"key": cache_key, "time": time.time(), "git_info": git_info}
+            )
+        except OSError:
+            pass
+    
+    return git_info
 
 
 def get_project_name():
     """Get project name from package.json, pyproject.toml, or current directory."""
-    # Try package.json first (Node.js projects)
-    package_json_path = Path("package.json")
-    if package_json_path.exists():
-        try:
-            with open(package_json_path) as f:
-                package_data = json.load(f)
-                name = package_data.get("name")
-                if name:
-                    return name
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
+    # Try package.json first (Node.js projects); open directly instead of exists() + open()
+    try:
+        with open("package.json") as f:
+            package_data = json.load(f)
+            name = package_data.get("name")
+            if name:
+                return name
+    except (json.JSONDecodeError, OSError):
+        pass
     
-    # Try pyproject.toml (Python projects)
-    pyproject_path = Path("pyproject.toml")
-    if pyproject_path.exists():
-        try:
-            import tomllib
-        except ImportError:
+    # Try pyproject.toml (Python projects); the TOML parser is only imported if it opens
+    try:
+        pyproject_file = open("pyproject.toml", "rb")
+    except OSError:
+        pyproject_file = None
+    
+    if pyproject_file:
+        with pyproject_file:
             try:
-                import tomli as tomllib
+                import tomllib
             except ImportError:
-                tomllib = None
-        
-        if tomllib:
-            try:
-                with open(pyproject_path, "rb") as f:
-                    pyproject_data = tomllib.load(f)
+                try:
+                    import tomli as tomllib
+                except ImportError:
+                    tomllib = None
+            
+            if tomllib:
+                try:
+                    pyproject_data = tomllib.load(pyproject_file)
                     name = pyproject_data.get("project", {}).get("name")
                     if name:
                         return name
-            except Exception:
-                pass
+                except Exception:
+                    pass
     
     # Fallback to current directory name
     return Path.cwd().name
@@ -146,8 +345,6 @@ def create_context_bar(percent, tokens, bar_length=16):
     return "".join(bar_parts) + RESET
 
 
-
-
 def format_duration(duration_ms):
     """Format duration in milliseconds to human readable."""
     if duration_ms < 60000:
@@ -160,8 +357,6 @@ def format_duration(duration_ms):
         return f"{hours}h{minutes}m"
 
 
-
-
 def format_tokens(tokens):
     """Format token count to readable format."""
     if tokens < 1000:
@@ -172,23 +367,47 @@ def format_tokens(tokens):
         return f"{tokens // 1000000}M"
 
 
+def get_prompt_text(entry):
+    """Get the text of a user prompt transcript entry, or None if it isn't one."""
+    if entry.get('type') != 'user' or entry.get('isVisibleInTranscriptOnly'):
+        return None
+    
+    # Check for different content structures
+    content = entry.get('content') or entry.get('message', {}).get('content')
+    if not content:
+        return None
+    if isinstance(content, list):
+        # Get text from content array
+        text_parts = [item.get('text', '') for item in content if item.get('type') == 'text']
+        if not text_parts:
+            return None
+        content = ' '.join(text_parts)
+    elif not isinstance(content, str):
+        return None
+    
+    # Skip hook messages and system content, same filter for both shapes
+    if SYSTEM_CONTENT_PATTERN.search(content):
+        return None
+    return content
+
+
 def get_last_prompt_from_session(session_id):
     """Get the last prompt from the session file."""
     try:
-        # Try different session file paths
-        cwd_path = str(Path.cwd()).replace("/", "-")
-        if cwd_path.startswith("-"):
-            cwd_path = cwd_path[1:]
-        
-        project_dir = Path.home() / ".claude" / "projects" / f"-{cwd_path}"
+        # Try different session file paths; the project dir is the absolute cwd
+        # with every "/" turned into "-" (so it starts with "-"), built in one pass
+        project_dir = Path.home() / ".claude" / "projects" / str(Path.cwd()).replace("/", "-")
         
         if project_dir.exists():
-            # Find the most recent session file in the project directory
-            session_files = list(project_dir.glob("*.jsonl"))
-            if session_files:
-                # Get the most recently modified session file
-                session_file = max(session_files, key=lambda p: p.stat().st_mtime)
-            else:
+            # Find the most recently modified session file in a single pass;
+            # scandir entries are plain names, no Path object per transcript
+            with os.scandir(project_dir) as entries:
+                session_file = max(
+                    (entry for entry in entries if entry.name.endswith(".jsonl")),
+                    key=lambda entry: entry.stat().st_mtime,
+                    default=None
+                )
+            if session_file is None:
                 return "No sessions in project"
         else:
             # Fallback to session_id if provided
@@ -196,42 +415,19 @@ def get_last_prompt_from_session(session_id):
             if not session_file.exists():
                 return f"No project dir: {project_dir.name}"
         
-        # Read the last line that contains a user prompt
-        last_prompt = "No prompts found"
-        with open(session_file, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get('type') == 'user' and not entry.get('isVisibleInTranscriptOnly'):
-                        # Check for different content structures
-                        content = entry.get('content') or entry.get('message', {}).get('content')
-                        if content:
-                            if isinstance(content, list) and len(content) > 0:
-                                # Get text from content array
-                                text_parts = [item.get('text', '') for item in content if item.get('type') == 'text']
-                                if text_parts:
-                                    prompt_text = ' '.join(text_parts)
-                                    # Skip hook messages and system content
-                                    if not any(skip in prompt_text.lower() for skip in [
-                                        'edit operation feedback', 
-                                        '.claude/hooks/',
-                                        'user-prompt-submit-hook',
-                                        'critical: always follow'
-                                    ]):
-                                        last_prompt = prompt_text
-                            elif isinstance(content, str):
-                                # Skip hook messages and system content
-                                if not any(skip in content.lower() for skip in [
-                                    'edit operation feedback',
-                                    '.claude/hooks/', 
-                                    'user-prompt-submit-hook',
-                                    'critical: always follow'
-                                ]):
-                                    last_prompt = content
-                except json.JSONDecodeError:
-                    continue
+        # Walk back from the end, so the newest user prompt is the first one found
+        for line in iter_lines_reversed(session_file):
+            # Every user entry carries a literal "user"; skip parsing the rest
+            if b'"user"' not in line:
+                continue
+            try:
+                prompt_text = get_prompt_text(json.loads(line.strip()))
+                if prompt_text is not None:
+                    return prompt_text
+            except json.JSONDecodeError:
+                continue
         
-        return last_prompt
+        return "No prompts found"
     except Exception:
         return "Session read error"
 
@@ -245,42 +441,104 @@ def truncate_prompt(prompt, max_length=40):
 
 def get_prompt_icon(prompt_text):
     """Get an icon for the prompt based on its content."""
-    prompt_lower = prompt_text.lower()
+    rule = find_first_rule(PROMPT_ICON_PATTERN, prompt_text)
+    if rule is not None:
+        return PROMPT_ICON_RULES[rule][0]
+    return "💬"
+
+
+def get_ccusage_metrics(raw_input, transcript_path):
+    """
+    Get (tokens, context_percent, reset_at) from ccusage; any of them may be None.
+    raw_input is the status line payload exactly as read from stdin (bytes).
+    Results are cached per transcript and reused until its mtime or size changes,
+    so re-renders between messages skip the npx round trip.
+    """
+    cache_key = None
+    if transcript_path:
+        try:
+            stat = os.stat(transcript_path)
+            cache_key = [transcript_path, stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            pass
     
-    if any(word in prompt_lower for word in ['code', 'function', 'class', 'debug', 'implement']):
-        return "💻"
-    elif any(word in prompt_lower for word in ['file', 'read', 'write', 'create', 'delete']):
-        return "📁"
-    elif any(word in prompt_lower for word in ['analyze', 'research', 'explain', 'understand']):
-        return "🔍"
-    elif any(word in prompt_lower for word in ['document', 'comment', 'readme', 'docs']):
-        return "📝"
-    elif any(word in prompt_lower for word in ['test', 'spec', 'unit', 'integration']):
-        return "🧪"
-    elif any(word in prompt_lower for word in ['git', 'commit', 'push', 'pull', 'merge']):
-        return "🔀"
-    elif any(word in prompt_lower for word in ['fix', 'bug', 'error', 'issue']):
-        return "🔧"
-    elif any(word in prompt_lower for word in ['deploy', 'build', 'release']):
-        return "🚀"
-    elif any(word in prompt_lower for word in ['security', 'auth', 'password']):
-        return "🔒"
-    elif any(word in prompt_lower for word in ['performance', 'optimize', 'speed']):
-        return "⚡"
-    else:
-        return "💬"
+    if cache_key:
+        try:
+            with open(CCUSAGE_CACHE_PATH) as f:
+                cached = json.load(f)
+            if cached.get("key") == cache_key:
+                return cached["tokens"], cached["context_percent"], cached["reset_at"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass  # Missing or unreadable cache, query ccusage
+    
+    tokens = context_percent = reset_at = None
+    try:
+        ccusage_result = subprocess.run(
+            ["npx", "-y", "ccusage@latest", "statusline"], 
+            input=raw_input,  # Forward the payload as-is, no re-serialising
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # npx progress noise is never read
+            timeout=3
+        )
+    except Exception:
+        return None, None, None  # Don't cache failures
+    
+    ccusage_line = ccusage_result.stdout.strip()
+    if ccusage_result.returncode != 0 or not ccusage_line:
+        return None, None, None
+    
+    ccusage_line = ccusage_line.decode("utf-8", errors="replace")
+    
+    # Extract tokens and percentage from ccusage output
+    token_match = CCUSAGE_TOKENS_PATTERN.search(ccusage_line)
+    if token_match:
+        tokens = int(token_match.group(1).replace(',', ''))
+        context_percent = int(token_match.group(2))
+    
+    # Extract time left from ccusage (e.g., "2h 9m left") as an absolute reset time
+    time_match = CCUSAGE_TIME_LEFT_PATTERN.search(ccusage_line)
+    if time_match:
+        hours_left = int(time_match.group(1))
+        minutes_left = int(time_match.group(2))
+        reset_at = time.time() + hours_left * 3600 + minutes_left * 60
+    
+    if cache_key:
+        try:
+            write_cache_file(CCUSAGE_CACHE_PATH, {
+                "key": cache_key,
+                "tokens": tokens,
+                "context_percent": context_percent,
+                "reset_at": reset_at
+            })
+        except OSError:
+            pass
+    
+    return tokens, context_percent, reset_at
 
 
 def main():
     """Generate Claude Code status line."""
     try:
-        # Read JSON input from Claude Code
-        input_data = json.load(sys.stdin)
+        # Read JSON input from Claude Code as raw bytes; ccusage gets the same bytes
+        raw_input = sys.stdin.buffer.read()
+        input_data = json.loads(raw_input)
         
         # Extract data from JSON
         model = input_data.get("model", {}).get("display_name", "Unknown")
         transcript_path = input_data.get("transcript_path", "")
         
+        # ccusage (an npx process, up to 3s on a cache miss) doesn't depend on the
+        # version, git and transcript reads below, so run it alongside them; a bare
+        # thread since subprocess already loaded threading, unlike concurrent.futures
+        import threading
+        ccusage_metrics = [None, None, None]
+        
+        def fetch_ccusage_metrics():
+            ccusage_metrics[:] = get_ccusage_metrics(raw_input, transcript_path)
+        
+        ccusage_thread = threading.Thread(target=fetch_ccusage_metrics, daemon=True)
+        ccusage_thread.start()
+        
         # Get version dynamically from Claude binary symlink
         try:
             claude_path = Path.home() / ".local/bin/claude"
@@ -309,41 +567,19 @@ def main():
         
         # Simple fallback: estimate tokens from file size
         tokens, context_percent = 0, 0
-        if transcript_path and Path(transcript_path).exists():
-            file_size = Path(transcript_path).stat().st_size
-            tokens = file_size * 10 // 62  # Simple ratio-based estimate
-            context_percent = min(100, (tokens * 100) // 200000)  # 200k token limit
+        if transcript_path:
+            try:
+                file_size = os.stat(transcript_path).st_size  # One stat, no exists() first
+                tokens = file_size * 10 // 62  # Simple ratio-based estimate
+                context_percent = min(100, (tokens * 100) // 200000)  # 200k token limit
+            except OSError:
+                pass  # Missing transcript, keep zero estimate
         
         # Try to get ccusage data for more accurate metrics
-        ccusage_time_left = None
-        try:
-            import subprocess
-            import re
-            ccusage_result = subprocess.run(
-                ["npx", "-y", "ccusage@latest", "statusline"], 
-                input=json.dumps(input_data),
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-            if ccusage_result.returncode == 0 and ccusage_result.stdout.strip():
-                ccusage_line = ccusage_result.stdout.strip()
-                
-                # Extract tokens and percentage from ccusage output
-                token_match = re.search(r'🧠\s*([\d,]+)\s*\((\d+)%\)', ccusage_line)
-                if token_match:
-                    ccusage_tokens_str = token_match.group(1).replace(',', '')
-                    tokens = int(ccusage_tokens_str)
-                    context_percent = int(token_match.group(2))
-                
-                # Extract time left from ccusage (e.g., "2h 9m left")
-                time_match = re.search(r'\((\d+)h\s*(\d+)m\s*left\)', ccusage_line)
-                if time_match:
-                    hours_left = int(time_match.group(1))
-                    minutes_left = int(time_match.group(2))
-                    ccusage_time_left = (hours_left, minutes_left)
-        except Exception:
-            pass  # Use fallback data
+        ccusage_thread.join()
+        ccusage_tokens, ccusage_percent, ccusage_reset_at = ccusage_metrics
+        if ccusage_tokens is not None:
+            tokens, context_percent = ccusage_tokens, ccusage_percent
         
         context_bar = create_context_bar(context_percent, tokens)
         
@@ -377,10 +613,9 @@ def main():
         from datetime import datetime, timedelta
         now = datetime.now()
         
-        if ccusage_time_left:
+        if ccusage_reset_at:
             # Use ccusage's accurate time remaining
-            hours_left, minutes_left = ccusage_time_left
-            reset_time = now + timedelta(hours=hours_left, minutes=minutes_left)
+            reset_time = datetime.fromtimestamp(ccusage_reset_at)
         else:
             # Fallback: Assume 5-hour blocks starting at midnight
             hours_since_midnight = now.hour + now.minute / 60